@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import sys
+import queue
+import atexit
 import argparse
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Tuple
-from multiprocessing import Pool, cpu_count
+from typing import List, Tuple, Optional, FrozenSet
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import utils_git as utils
 import gitignore_fetcher
 
@@ -15,6 +19,24 @@ import gitignore_fetcher
 
 logger = utils.setup_logging(__name__)
 
+def _start_log_listener() -> QueueListener:
+    """
+    logger의 출력을 큐 + 리스너 스레드 하나로 넘김
+    
+    워커 스레드들은 큐에 레코드를 넣기만 하고 stderr 핸들러의 락을 두고 경쟁하지 않습니다.
+    기존 핸들러는 리스너로 옮겨지고 logger에는 QueueHandler만 남습니다.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """남은 로그를 모두 출력한 뒤 logger의 원래 핸들러를 복원"""
+    listener.stop()
+    logger.handlers = list(listener.handlers)
+
 # ============================================================================
 # 인자 파싱
 # ============================================================================
@@ -29,7 +51,8 @@ def parse_args() -> argparse.Namespace:
 1) 지정된 타입의 .gitignore 설정 및 Git 초기화
 2) 최종적으로 Git Clone하여 Output 디렉터리에 복제
 
-여러 프로젝트는 multiprocessing으로 병렬 처리됩니다.
+여러 프로젝트는 스레드 풀로 병렬 처리됩니다.
+(작업 대부분이 git 서브프로세스 대기이므로 프로세스 대신 스레드를 사용합니다.)
 
 Usage:
   python batch_convert_unity_projects_v2.py --projects_dir "C:/Projects" --output_dir "C:/Output" --type "Unity" --workers 4
@@ -54,7 +77,7 @@ Usage:
         "--workers",
         type=int,
         default=None,
-        help=f"Number of worker processes (default: CPU count)"
+        help="Number of worker threads (default: min(32, CPU count * 4))"
     )
     parser.add_argument(
         "--type",
@@ -62,35 +85,74 @@ Usage:
         default="Unity",
         help="Project type to fetch appropriate .gitignore (default: Unity)"
     )
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help="Clone with --shared so the clone borrows objects from the source repository instead of copying them "
+             "(faster, but the clone breaks if the source repository is moved, deleted or garbage-collected)"
+    )
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="Hardlink committed files from the source instead of checking them out "
+             "(same file system only; linked files share content with the source, so editing one in place edits both)"
+    )
     return parser.parse_args()
 
 # ============================================================================
-# 유틸리티 함수
+# 워커 공유 상태
 # ============================================================================
 
-def is_in_blacklist(project_name: str, blacklist_list: List[str]) -> bool:
+# 모든 작업이 공통으로 사용하는 값들 (작업마다 넘기지 않고 배치 시작 시 한 번만 설정)
+# 워커는 같은 프로세스의 스레드이므로 별도 복사 없이 그대로 공유됨
+_WORKER_STATE = {}
+
+def _init_worker(
+    gitignore_content: str,
+    output_dir: Path,
+    blacklist_set: FrozenSet[str],
+    shared: bool = False,
+    hardlink: bool = False,
+    checkout_workers: Optional[int] = None
+) -> None:
     """
-    프로젝트 이름이 블랙리스트에 포함되어 있는지 확인
+    워커 공유 상태 초기화 함수 (작업 제출 전 호출 스레드에서 한 번 호출)
+    
+    Args:
+        gitignore_content: .gitignore 파일에 기록할 내용
+        output_dir: 출력(클론) 디렉터리
+        blacklist_set: 블랙리스트
+        shared: 클론 시 --shared 사용 여부
+        hardlink: 클론 작업 트리를 하드링크로 채울지 여부
+        checkout_workers: 클론 하나당 체크아웃 병렬 워커 수
     """
-    return any(project_name == item.strip() for item in blacklist_list)
+    _WORKER_STATE["gitignore_content"] = gitignore_content
+    _WORKER_STATE["output_dir"] = output_dir
+    _WORKER_STATE["blacklist_set"] = blacklist_set
+    _WORKER_STATE["shared"] = shared
+    _WORKER_STATE["hardlink"] = hardlink
+    _WORKER_STATE["checkout_workers"] = checkout_workers
 
-def process_single_project(args: Tuple[Path, Path, List[str], str]) -> Tuple[str, bool]:
+def process_single_project(project_path: Path) -> Tuple[str, bool]:
     """
-    단일 프로젝트 처리 함수 (multiprocessing용)
+    단일 프로젝트 처리 함수 (스레드 풀 작업 단위)
     
     Git 초기화 및 커밋 → 클론을 연속으로 수행
+    공통 값(출력_디렉터리, 블랙리스트, gitignore_content)은 _WORKER_STATE에서 읽음
     
     Args:
-        args: (프로젝트_경로, 출력_디렉터리, 블랙리스트, gitignore_content)
+        project_path: 프로젝트 경로
         
     Returns:
         (프로젝트_이름, 성공_여부)
     """
-    project_path, output_dir, blacklist_list, gitignore_content = args
+    output_dir = _WORKER_STATE["output_dir"]
+    blacklist_set = _WORKER_STATE["blacklist_set"]
+    gitignore_content = _WORKER_STATE["gitignore_content"]
     project_name = project_path.name
     
     # 블랙리스트 확인
-    if is_in_blacklist(project_name, blacklist_list):
+    if project_name in blacklist_set:
         logger.info(f"[SKIP] '{project_name}' is enlisted in the blacklist")
         return project_name, False
     
@@ -107,15 +169,16 @@ def process_single_project(args: Tuple[Path, Path, List[str], str]) -> Tuple[str
         return project_name, False
     
     # Step 2: 클론 수행
+    # (출력 폴더가 이미 있는 프로젝트는 main()에서 미리 걸러짐)
     clone_target = output_dir / project_name
     
-    # Output path 존재 여부는 utils.clone_project 내부에서도 체크하지만, 
-    # Batch 버전은 "SKIP" 메시지를 원하므로 미리 체크
-    if clone_target.exists():
-        logger.info(f"[SKIP] '{project_name}' → Output folder already exists: {clone_target}")
-        return project_name, False
-
-    success, msg = utils.clone_project(project_path, clone_target)
+    success, msg = utils.clone_project(
+        project_path,
+        clone_target,
+        shared=_WORKER_STATE["shared"],
+        hardlink=_WORKER_STATE["hardlink"],
+        checkout_workers=_WORKER_STATE["checkout_workers"]
+    )
     
     if success:
         # utils.clone_project의 리턴 메시지를 사용하여 포맷팅
@@ -126,6 +189,96 @@ def process_single_project(args: Tuple[Path, Path, List[str], str]) -> Tuple[str
     
     return project_name, True
 
+# ============================================================================
+# 배치 실행
+# ============================================================================
+
+# 기본 워커 수 (스레드는 가벼우므로 CPU 수보다 넉넉하게)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# 여러 번의 run_batch 호출에서 재사용하는 스레드 풀 (최초 사용 시 생성)
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+
+def _get_executor(workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    모듈 단위 스레드 풀을 반환 (없으면 생성)
+    
+    workers를 지정하지 않으면 기존 풀을 그대로 재사용하고(없으면 DEFAULT_WORKERS로 생성),
+    기존 풀과 다른 workers를 지정하면 기존 풀을 정리한 뒤 새로 생성합니다.
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    if _EXECUTOR is not None and workers is not None and workers != _EXECUTOR_WORKERS:
+        _EXECUTOR.shutdown(wait=True)
+        _EXECUTOR = None
+    if _EXECUTOR is None:
+        _EXECUTOR_WORKERS = workers or DEFAULT_WORKERS
+        _EXECUTOR = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS)
+    return _EXECUTOR
+
+def _shutdown_executor() -> None:
+    """프로그램 종료 시 스레드 풀 정리"""
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=True)
+
+atexit.register(_shutdown_executor)
+
+def run_batch(
+    projects: List[Path],
+    gitignore_content: str,
+    output_dir: Path,
+    blacklist_set: FrozenSet[str],
+    workers: Optional[int] = None,
+    shared: bool = False,
+    hardlink: bool = False
+) -> List[Tuple[str, bool]]:
+    """
+    여러 프로젝트를 병렬로 처리
+    
+    스레드 풀은 모듈 단위로 유지되므로 같은 프로세스에서 반복 호출해도 다시 만들지 않습니다.
+    (이전 호출과 다른 workers를 지정한 경우에만 새로 만듦)
+    공유 상태(_WORKER_STATE)를 덮어쓰므로 동시에 여러 번 호출하면 안 됩니다.
+    
+    Args:
+        projects: 처리할 프로젝트 경로 목록
+        gitignore_content: .gitignore 파일에 기록할 내용
+        output_dir: 출력(클론) 디렉터리
+        blacklist_set: 블랙리스트
+        workers: (선택) 워커 수 (기본: 기존 풀의 워커 수, 풀이 없으면 DEFAULT_WORKERS)
+        shared: 클론 시 --shared 사용 여부
+        hardlink: 클론 작업 트리를 하드링크로 채울지 여부
+        
+    Returns:
+        [(프로젝트_이름, 성공_여부), ...] (끝난 순서대로)
+    """
+    executor = _get_executor(workers)
+    
+    # 동시에 실행되는 클론 수(워커 수와 프로젝트 수 중 작은 값)로 CPU 수를 나눠 체크아웃 병렬 워커 수를 정함
+    # 동시 클론이 CPU 수 이상이면 프로젝트 단위 병렬만으로 충분하므로 체크아웃은 순차(1)로 둠
+    concurrent_clones = max(1, min(_EXECUTOR_WORKERS, len(projects)))
+    checkout_workers = max(1, (os.cpu_count() or 1) // concurrent_clones)
+    
+    # 작업 인자는 프로젝트 경로만 전달하고, 공통 값은 작업 제출 전에 한 번만 설정
+    # (스레드마다 initializer를 다시 실행할 필요 없음)
+    _init_worker(gitignore_content, output_dir, blacklist_set, shared, hardlink, checkout_workers)
+    
+    listener = _start_log_listener()
+    
+    try:
+        futures = [executor.submit(process_single_project, p) for p in projects]
+        
+        # 끝나는 순서대로 결과 수집 및 진행 상황 출력
+        # (스레드 풀은 IPC 큐가 없으므로 chunksize 묶음 전송이 필요 없음)
+        results = []
+        for future in as_completed(futures):
+            project_name, success = future.result()
+            results.append((project_name, success))
+            logger.info(f"[{len(results)}/{len(futures)}] '{project_name}' finished")
+    finally:
+        _stop_log_listener(listener)
+    
+    return results
+
 # ============================================================================
 # 메인 함수
 # ============================================================================
@@ -137,11 +290,14 @@ def main():
     projects_dir = Path(args.projects_dir)
     output_dir = Path(args.output_dir)
     blacklist_str = args.blacklist.strip()
-    workers = args.workers or cpu_count()
+    workers = args.workers or DEFAULT_WORKERS
     project_type = args.type
+    shared = args.shared
+    hardlink = args.hardlink
     
     # 블랙리스트 파싱
-    blacklist_list = [x for x in blacklist_str.split(",") if x.strip()] if blacklist_str else []
+    # 블랙리스트는 파싱 후 바뀌지 않으므로 트림한 이름의 frozenset으로 한 번만 만들어 둠
+    blacklist_set = frozenset(x.strip() for x in blacklist_str.split(",") if x.strip())
     
     # ========================================================================
     # 입력 검증
@@ -157,8 +313,10 @@ def main():
     logger.info(f"Projects Directory: {projects_dir}")
     logger.info(f"Output Directory: {output_dir}")
     logger.info(f"Project Type: {project_type}")
-    logger.info(f"Blacklist: {blacklist_list if blacklist_list else 'None'}")
+    logger.info(f"Blacklist: {sorted(blacklist_set) if blacklist_set else 'None'}")
     logger.info(f"Workers: {workers}")
+    logger.info(f"Shared Clone: {'ON' if shared else 'OFF'}")
+    logger.info(f"Hardlink Mode: {'ON' if hardlink else 'OFF'}")
     logger.info("=" * 70)
 
     # ========================================================================
@@ -179,11 +337,25 @@ def main():
     # 처리할 프로젝트 목록 수집
     # ========================================================================
     
-    projects_to_process = [
-        p for p in projects_dir.iterdir()
-        if p.is_dir() and not is_in_blacklist(p.name, blacklist_list)
+    # os.scandir의 DirEntry는 readdir 결과의 파일 타입을 재사용하므로 항목마다 stat을 다시 하지 않음
+    project_entries = [
+        entry for entry in os.scandir(projects_dir)
+        if entry.is_dir() and entry.name not in blacklist_set
     ]
     
+    # inode 순으로 정렬해 디스크상 가까운 프로젝트부터 처리 (HDD 탐색 감소, readahead 효율 향상)
+    # POSIX에서는 inode()가 readdir 결과를 그대로 쓰므로 추가 syscall이 없음
+    project_entries.sort(key=lambda entry: entry.inode())
+    projects_to_process = [Path(entry.path) for entry in project_entries]
+    
+    # 출력 디렉터리를 한 번만 읽어 이미 클론된 프로젝트를 작업 제출 전에 제외
+    # (프로젝트마다 exists()로 stat 하지 않음)
+    existing_outputs = frozenset(entry.name for entry in os.scandir(output_dir))
+    for p in projects_to_process:
+        if p.name in existing_outputs:
+            logger.info(f"[SKIP] '{p.name}' → Output folder already exists: {output_dir / p.name}")
+    projects_to_process = [p for p in projects_to_process if p.name not in existing_outputs]
+    
     if not projects_to_process:
         logger.warning("No projects to process.")
         sys.exit(0)
@@ -192,17 +364,10 @@ def main():
     logger.info("=" * 70)
     
     # ========================================================================
-    # Multiprocessing으로 병렬 처리
+    # 스레드 풀로 병렬 처리
     # ========================================================================
     
-    # 각 프로젝트마다 (프로젝트_경로, 출력_디렉터리, 블랙리스트, gitignore_content) 튜플 생성
-    process_args = [
-        (project_path, output_dir, blacklist_list, gitignore_content)
-        for project_path in projects_to_process
-    ]
-    
-    with Pool(processes=workers) as pool:
-        results = pool.map(process_single_project, process_args)
+    results = run_batch(projects_to_process, gitignore_content, output_dir, blacklist_set, workers, shared, hardlink)
     
     # ========================================================================
     # 결과 요약
@@ -1,5 +1,59 @@
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+
+API_URL = "https://api.github.com/gitignore/templates"
+
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": "gzip",
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+KNOWN_TEMPLATES = {
+    "unity": "Unity",
+    "unrealengine": "UnrealEngine",
+    "godot": "Godot",
+    "python": "Python",
+    "node": "Node",
+    "java": "Java",
+    "c++": "C++",
+    "c": "C",
+    "go": "Go",
+    "rust": "Rust",
+    "visualstudio": "VisualStudio",
+}
+
+
+def _save_to_local(local_dir: Path, template_name: str, content: str):
+    try:
+        (local_dir / f"{template_name}.gitignore").write_text(content, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _fetch_template_source(template_name: str):
+    detail_resp = _SESSION.get(f"{API_URL}/{template_name}")
+    if detail_resp.status_code == 404:
+        return None
+    detail_resp.raise_for_status()
+    
+    return detail_resp.json().get('source')
+
+
+def _find_template_name(project_type: str):
+    response = _SESSION.get(API_URL)
+    response.raise_for_status()
+    available_templates = response.json()
+    
+    target_lower = project_type.lower()
+    
+    for template in available_templates:
+        if template.lower() == target_lower:
+            return template
+    return None
 
 
 def fetch_gitignore(
@@ -22,31 +76,19 @@ def fetch_gitignore(
     if not try_fetch_from_github:
         return None
 
-    api_url = "https://api.github.com/gitignore/templates"
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
-        available_templates = response.json()
-        
-        target_lower = project_type.lower()
-        found_template = None
+        found_template = KNOWN_TEMPLATES.get(project_type.lower(), project_type)
+        gitignore_content = _fetch_template_source(found_template)
         
-        for template in available_templates:
-            if template.lower() == target_lower:
-                found_template = template
-                break
+        if gitignore_content is None:
+            found_template = _find_template_name(project_type)
+            if not found_template:
+                return None
+            gitignore_content = _fetch_template_source(found_template)
         
-        if found_template:
-            detail_url = f"https://api.github.com/gitignore/templates/{found_template}"
-            detail_resp = requests.get(detail_url, headers=headers)
-            detail_resp.raise_for_status()
-            
-            gitignore_content = detail_resp.json().get('source')
-            return gitignore_content
-        else:
-            return None
+        if gitignore_content:
+            _save_to_local(local_dir, found_template, gitignore_content)
+        return gitignore_content
 
     except requests.exceptions.RequestException:
         return None
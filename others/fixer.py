@@ -67,24 +67,13 @@ def commit_changes(directory: str, commit_message: str = "Auto-commit changes"):
             print(f"[ERROR] '{directory}' 경로에서 커밋에 실패했습니다: {e}")
 
 
-def is_in_blacklist(project_name: str, blacklist_list: list[str]) -> bool:
-    """
-    프로젝트 이름이 블랙리스트에 포함되어 있는지 확인
-    블랙리스트 문자열들을 양쪽 공백 제거 후(트림) 비교
-    """
-    for item in blacklist_list:
-        trimmed_item = item.strip()
-        if project_name == trimmed_item:
-            return True
-    return False
-
-
-def get_project_not_blacklisted(dir: str, blacklist: list):
+def get_project_not_blacklisted(dir: str, blacklist: set):
+    """블랙리스트(트림된 이름의 set)에 없는 하위 프로젝트의 (경로, 이름)을 반환"""
     for entry in os.scandir(dir):
         if not entry.is_dir():
             continue
 
-        if is_in_blacklist(entry.name, blacklist):
+        if entry.name in blacklist:
             print(f"[SKIP] '{entry.name}'은(는) 블랙리스트에 포함되어 처리하지 않습니다.")
             continue
 
@@ -116,7 +105,7 @@ if __name__ == "__main__":
         fix((r"D:\Unity Projects\CharDemo", r"CharDemo"))
     else:
         project_dir = r"D:\Unity Projects"  # 프로젝트 부모 경로
-        blacklist = [
+        blacklist = {
             "90. 개인 연습",
             "91. 개인 작업",
             "92. 버림",
@@ -144,6 +133,6 @@ if __name__ == "__main__":
             "uma2",
             "VR",
             "VRDemo"
-        ]
+        }
         for entry in get_project_not_blacklisted(project_dir, blacklist):
             fix(entry)
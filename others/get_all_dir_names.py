@@ -3,16 +3,10 @@ import os
 def get_subfolder_names(path):
     try:
         # 경로에 있는 하위 폴더 이름만 반환
-        subfolders = [
-            name for name in os.listdir(path)
-            if os.path.isdir(os.path.join(path, name))
-        ]
-        return subfolders
-    except FileNotFoundError:
-        print(f"Error: The directory '{path}' does not exist.")
-        return []
-    except PermissionError:
-        print(f"Error: Permission denied for accessing '{path}'.")
+        # DirEntry.is_dir()는 readdir 결과를 사용하므로 항목마다 stat이나 경로 결합을 하지 않음
+        return [entry.name for entry in os.scandir(path) if entry.is_dir(follow_symlinks=False)]
+    except (FileNotFoundError, PermissionError) as e:
+        print(f"Error: Cannot access '{path}': {e.strerror}")
         return []
 
 # 사용 예시
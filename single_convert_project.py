@@ -51,6 +51,18 @@ Usage:
         action="store_true",
         help="Force clone even if output path already exists (will remove existing directory)"
     )
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help="Clone with --shared so the clone borrows objects from the source repository instead of copying them "
+             "(faster, but the clone breaks if the source repository is moved, deleted or garbage-collected)"
+    )
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="Hardlink committed files from the source instead of checking them out "
+             "(same file system only; linked files share content with the source, so editing one in place edits both)"
+    )
     parser.add_argument(
         "--type",
         type=str,
@@ -70,6 +82,8 @@ def main():
     project_path = Path(args.project_path)
     output_path = Path(args.output_path)
     force = args.force
+    shared = args.shared
+    hardlink = args.hardlink
     project_type = args.type
     
     # ========================================================================
@@ -85,6 +99,8 @@ def main():
     logger.info(f"Output Path:   {output_path}")
     logger.info(f"Project Type:  {project_type}")
     logger.info(f"Force Mode:    {'ON' if force else 'OFF'}")
+    logger.info(f"Shared Clone:  {'ON' if shared else 'OFF'}")
+    logger.info(f"Hardlink Mode: {'ON' if hardlink else 'OFF'}")
     logger.info("=" * 70)
 
     # ========================================================================
@@ -126,7 +142,7 @@ def main():
     logger.info("-" * 70)
     
     # utils 모듈 사용
-    success, msg = utils.clone_project(project_path, output_path, force=force, verbose_logger=logger)
+    success, msg = utils.clone_project(project_path, output_path, force=force, verbose_logger=logger, shared=shared, hardlink=hardlink)
     if not success:
         logger.error(f"Failed: {msg}")
         sys.exit(1)
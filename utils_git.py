@@ -7,6 +7,9 @@
 (범용성을 위해 하드코딩된 gitignore 상수를 제거하고 외부 주입 방식으로 변경됨)
 """
 
+import os
+import sys
+import shlex
 import logging
 import subprocess
 import shutil
@@ -45,6 +48,10 @@ def has_gitignore(directory: Path) -> bool:
     gitignore_path = directory / ".gitignore"
     return gitignore_path.is_file()
 
+def _error_message(e: subprocess.CalledProcessError) -> str:
+    """실패한 명령의 stderr를 문자열로 변환 (실패했을 때만 디코딩)"""
+    return e.stderr.decode("utf-8", errors="replace") if e.stderr else str(e)
+
 def run_git_command(git_args: List[str], cwd: Path) -> Tuple[bool, str]:
     """Git 명령어 실행"""
     try:
@@ -59,6 +66,93 @@ def run_git_command(git_args: List[str], cwd: Path) -> Tuple[bool, str]:
         error_msg = e.stderr if e.stderr else str(e)
         return False, error_msg
 
+def run_git_batch(
+    commands: List[List[str]],
+    cwd: Path,
+    input: Optional[bytes] = None,
+    capture_stdout: bool = False
+) -> Tuple[bool, str]:
+    """
+    여러 Git 명령어를 셸 하나에서 && 로 연결해 실행 (앞 명령이 실패하면 중단)
+    
+    Python에서 git 프로세스를 명령마다 따로 띄우는 대신 셸 프로세스 한 번만 생성합니다.
+    
+    Args:
+        commands: git 뒤에 붙을 인자 리스트들 (예: [["add", "."], ["commit", "-m", "msg"]])
+        cwd: 명령을 실행할 디렉터리
+        input: (선택) 셸의 stdin으로 넘길 데이터 (stdin을 읽는 명령이 사용)
+        capture_stdout: True이면 모든 명령의 stdout을 모아서 반환 (기본은 버림)
+        
+    Returns:
+        (성공 여부, stdout (capture_stdout일 때, 아니면 빈 문자열) 또는 에러 메시지)
+    """
+    if sys.platform == "win32":
+        script = " && ".join(subprocess.list2cmdline(["git"] + args) for args in commands)
+        # /s: 바깥 따옴표만 제거하고 나머지는 그대로 실행
+        shell_cmd = f'cmd /d /s /c "{script}"'
+    else:
+        script = " && ".join(shlex.join(["git"] + args) for args in commands)
+        shell_cmd = ["sh", "-c", script]
+    
+    try:
+        result = subprocess.run(
+            shell_cmd,
+            cwd=str(cwd),
+            input=input,
+            check=True,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        return True, result.stdout.decode("utf-8", errors="replace") if capture_stdout else ""
+    except subprocess.CalledProcessError as e:
+        return False, _error_message(e)
+
+def init_repo_and_get_identities(repo_path: Path) -> Tuple[bool, str, str]:
+    """
+    저장소를 초기화하고 그 안에서 git이 커밋에 기록할 작성자/커미터 정보를 조회 (셸 호출 한 번)
+    
+    저장소별 설정(includeIf 등)과 GIT_AUTHOR_* / GIT_COMMITTER_* 환경 변수가 반영되도록
+    초기화 직후 저장소 안에서 조회합니다.
+    git var -l은 user.name/user.email이 없어도 "사용자@호스트"로 대체해 성공하므로,
+    이름을 지정한 git var로 조회해 정보가 없으면 커밋 전에 실패하도록 합니다.
+    
+    Args:
+        repo_path: 초기화할 프로젝트 디렉터리 경로
+        
+    Returns:
+        (성공 여부, 작성자 또는 에러 메시지, 커미터) - 각각 "이름 <이메일> 타임스탬프 타임존" 형식
+    """
+    success, output = run_git_batch([
+        ["init", "-q"],
+        ["var", "GIT_AUTHOR_IDENT"],
+        ["var", "GIT_COMMITTER_IDENT"],
+    ], repo_path, capture_stdout=True)
+    if not success:
+        return False, output, ""
+    
+    author, committer = output.splitlines()
+    return True, author, committer
+
+def build_gitignore_commit_stream(gitignore_bytes: bytes, author: str, committer: str) -> bytes:
+    """
+    .gitignore 하나만 담은 커밋을 HEAD가 가리키는 브랜치에 만드는 git fast-import 입력 생성
+    
+    author / committer는 git var 출력 그대로("이름 <이메일> 타임스탬프 타임존") 사용하며,
+    이는 fast-import의 기본(raw) 날짜 형식과 같습니다.
+    """
+    message = b"Add .gitignore\n"
+    return b"".join([
+        b"blob\n",
+        b"mark :1\n",
+        b"data %d\n" % len(gitignore_bytes), gitignore_bytes, b"\n",
+        b"commit HEAD\n",
+        b"author %s\n" % author.encode("utf-8"),
+        b"committer %s\n" % committer.encode("utf-8"),
+        b"data %d\n" % len(message), message,
+        b"M 100644 :1 .gitignore\n",
+        b"\n",
+    ])
+
 # ============================================================================
 # 핵심 로직 함수
 # ============================================================================
@@ -97,13 +191,12 @@ def init_and_commit_project(
             # .gitignore 추가
             log_info(f"[INFO] Adding .gitignore to existing git repository: '{project_name}'")
             gitignore_path = project_path / ".gitignore"
-            gitignore_path.write_text(gitignore_content, encoding="utf-8")
-            
-            success, error = run_git_command(["add", ".gitignore"], project_path)
-            if not success:
-                return False, f"Failed to add .gitignore: {error}"
+            gitignore_path.write_bytes(gitignore_content.encode("utf-8"))
             
-            success, error = run_git_command(["commit", "-m", "Add .gitignore"], project_path)
+            success, error = run_git_batch([
+                ["add", ".gitignore"],
+                ["commit", "-q", "-m", "Add .gitignore"],
+            ], project_path)
             if not success:
                 return False, f"Failed to commit .gitignore: {error}"
             
@@ -111,40 +204,101 @@ def init_and_commit_project(
             return True, f"Added .gitignore to '{project_name}'"
     else:
         # 새로운 Git repository 초기화
-        log_info(f"[INFO] Initializing git repository: '{project_name}'")
-        
-        success, error = run_git_command(["init"], project_path)
-        if not success:
-            return False, f"Failed to initialize git: {error}"
-        
         # .gitignore 생성
         log_info(f"[INFO] Creating .gitignore: '{project_name}'")
         gitignore_path = project_path / ".gitignore"
-        gitignore_path.write_text(gitignore_content, encoding="utf-8")
-        
-        # .gitignore 커밋
-        success, error = run_git_command(["add", ".gitignore"], project_path)
-        if not success:
-            return False, f"Failed to add .gitignore: {error}"
-        
-        success, error = run_git_command(["commit", "-m", "Add .gitignore"], project_path)
-        if not success:
-            return False, f"Failed to commit .gitignore: {error}"
+        gitignore_bytes = gitignore_content.encode("utf-8")
+        gitignore_path.write_bytes(gitignore_bytes)
         
-        # 나머지 파일들 커밋
-        log_info(f"[INFO] Committing project files: '{project_name}'")
-        success, error = run_git_command(["add", "."], project_path)
+        # 작성자 정보는 저장소별 설정(includeIf 등)을 따르므로 저장소를 먼저 만든 뒤 그 안에서 조회
+        log_info(f"[INFO] Initializing git repository: '{project_name}'")
+        success, author, committer = init_repo_and_get_identities(project_path)
         if not success:
-            return False, f"Failed to add files: {error}"
+            return False, f"Failed to initialize git: {author}"
         
-        success, error = run_git_command(["commit", "-m", "Initial commit"], project_path)
+        # .gitignore 커밋 → 나머지 파일들 커밋을 한 번에 실행
+        # .gitignore 커밋은 인덱스를 거치지 않고 fast-import로 오브젝트와 커밋을 바로 기록
+        # (인덱스는 비어 있는 상태로 남으므로 이어지는 add가 .gitignore를 포함한 전체를 다시 담음)
+        log_info(f"[INFO] Committing .gitignore and project files: '{project_name}'")
+        success, error = run_git_batch([
+            ["fast-import", "--quiet"],
+            ["add", "."],
+            ["commit", "-q", "-m", "Initial commit"],
+        ], project_path, input=build_gitignore_commit_stream(gitignore_bytes, author, committer))
         if not success:
-            return False, f"Failed to commit files: {error}"
+            return False, f"Failed to initialize git repository: {error}"
         
         log_info(f"[DONE] Git repository initialized: '{project_name}'")
         return True, f"Git repository initialized for '{project_name}'"
 
-def clone_project(project_path: Path, output_path: Path, force: bool = False, verbose_logger: Optional[logging.Logger] = None) -> Tuple[bool, str]:
+def is_same_filesystem(path_a: Path, path_b: Path) -> bool:
+    """두 경로가 같은 파일 시스템(장치)에 있는지 확인 (하드링크 가능 여부)"""
+    try:
+        return path_a.stat().st_dev == path_b.stat().st_dev
+    except OSError:
+        return False
+
+def link_tracked_files(project_path: Path, output_path: Path) -> Tuple[int, List[str]]:
+    """
+    소스 프로젝트에서 HEAD에 커밋된 파일들을 출력 경로에 하드링크로 배치
+    
+    파일 내용을 복사하지 않고 파일마다 링크 한 번만 생성합니다.
+    (ignore된 파일은 HEAD에 없으므로 옮겨지지 않음)
+    링크할 수 없는 파일은 복사하고, 소스 작업 트리에 없어 링크도 복사도 못 한 파일은
+    경로를 모아 반환합니다. (호출 측에서 HEAD 내용으로 체크아웃)
+    
+    Args:
+        project_path: 소스 프로젝트 디렉터리 경로
+        output_path: 출력 경로 (--no-checkout으로 클론된 저장소)
+        
+    Returns:
+        (링크 또는 복사한 파일 수, 배치하지 못한 파일의 상대 경로 목록)
+        
+    Raises:
+        subprocess.CalledProcessError: 파일 목록 조회 실패 시
+    """
+    result = subprocess.run(
+        ["git", "-C", str(project_path), "ls-tree", "-r", "-z", "--name-only", "HEAD"],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    
+    count = 0
+    missing = []
+    for raw_name in result.stdout.split(b"\0"):
+        if not raw_name:
+            continue
+        rel_path = os.fsdecode(raw_name)
+        src = project_path / rel_path
+        dst = output_path / rel_path
+        
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(src, dst, follow_symlinks=False)
+        except FileNotFoundError:
+            # 소스 작업 트리에서 지워진 파일은 호출 측에서 HEAD 내용으로 체크아웃
+            missing.append(rel_path)
+            continue
+        except OSError:
+            # 하드링크를 지원하지 않는 파일 시스템, 링크 수 초과 등
+            try:
+                shutil.copy2(src, dst, follow_symlinks=False)
+            except OSError:
+                missing.append(rel_path)
+                continue
+        count += 1
+    return count, missing
+
+def clone_project(
+    project_path: Path,
+    output_path: Path,
+    force: bool = False,
+    verbose_logger: Optional[logging.Logger] = None,
+    shared: bool = False,
+    hardlink: bool = False,
+    checkout_workers: Optional[int] = None
+) -> Tuple[bool, str]:
     """
     프로젝트를 클론
     
@@ -153,6 +307,16 @@ def clone_project(project_path: Path, output_path: Path, force: bool = False, ve
         output_path: 출력 경로 (클론될 최종 위치, 폴더명 포함)
         force: 기존 디렉터리가 있어도 강제로 클론할지 여부
         verbose_logger: (선택) 상세 로깅용 로거
+        shared: True이면 --shared로 클론하여 오브젝트를 복사하지 않고 소스 저장소의 것을 참조.
+            빠르지만 클론이 소스 저장소의 .git/objects에 의존하게 되므로,
+            소스를 삭제/이동하거나 gc로 오브젝트가 정리되면 클론이 깨질 수 있음
+        hardlink: True이면 작업 트리 파일을 체크아웃하지 않고 소스의 파일을 하드링크로 배치.
+            소스와 출력이 같은 파일 시스템에 있을 때만 적용되며, 아니면 일반 클론으로 진행.
+            링크된 파일은 소스와 내용을 공유하므로 한쪽에서 파일을 직접 수정하면 다른 쪽도 바뀜.
+            소스 작업 트리에 커밋되지 않은 수정이 있으면 클론에서도 수정된 파일로 보이고,
+            소스에서 지워진 파일은 HEAD 내용으로 체크아웃됨
+        checkout_workers: (선택) 작업 트리 체크아웃에 사용할 병렬 워커 수 (기본: CPU 수).
+            여러 클론을 동시에 실행할 때는 전체가 CPU 수를 넘지 않도록 나눠서 지정
         
     Returns:
         (성공 여부, 메시지)
@@ -180,16 +344,62 @@ def clone_project(project_path: Path, output_path: Path, force: bool = False, ve
     # 출력 경로의 부모 디렉터리 생성
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    if hardlink and not is_same_filesystem(project_path, output_path.parent):
+        log_warning(f"[WARNING] '{project_name}' and '{output_path}' are on different file systems; cloning without hardlinks")
+        hardlink = False
+    
+    # checkout.workers: 작업 트리 체크아웃을 병렬로 수행 (Git 2.32+, 이전 버전은 설정을 무시)
+    #   파일 수가 checkout.thresholdForParallelism(기본 100) 미만이면 git이 알아서 순차 체크아웃
+    # core.fsync=none: 파일마다 fsync하지 않음 (클론 결과는 소스에서 언제든 다시 만들 수 있음)
+    # 로컬 경로 클론은 기본적으로 .git/objects를 직접 복사(가능하면 하드링크)하므로 --local은 지정하지 않음
+    # (--local을 명시하면 다른 드라이브로 클론할 때 하드링크 실패가 그대로 에러가 됨)
+    clone_args = [
+        "git",
+        "-c", f"checkout.workers={checkout_workers or os.cpu_count() or 1}",
+        "-c", "core.fsync=none",
+        "clone", "--quiet"
+    ]
+    if shared:
+        clone_args.append("--shared")
+    if hardlink:
+        # 작업 트리는 아래에서 하드링크로 채움
+        clone_args.append("--no-checkout")
+    
     try:
-        log_info(f"[INFO] Cloning '{project_name}' to '{output_path}'")
+        log_info(f"[INFO] Cloning '{project_name}' to '{output_path}'{' (shared objects)' if shared else ''}")
         subprocess.run(
-            ["git", "clone", str(project_path), str(output_path)],
+            clone_args + [str(project_path), str(output_path)],
             check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
+        
+        if hardlink:
+            log_info(f"[INFO] Linking tracked files from '{project_name}'")
+            linked, missing = link_tracked_files(project_path, output_path)
+            
+            # 인덱스를 HEAD로 채우고, 링크하지 못한(소스에 없는) 파일만 체크아웃
+            # (-a를 쓰면 수정된 채로 링크된 파일 때문에 실패하므로 경로를 지정.
+            #  경로 수가 많아도 명령줄 길이 제한에 걸리지 않도록 stdin으로 전달)
+            commands = [["reset", "-q"]]
+            if missing:
+                commands.append(["checkout-index", "-q", "-z", "--stdin"])
+            success, error = run_git_batch(
+                commands,
+                output_path,
+                input=b"".join(os.fsencode(path) + b"\0" for path in missing)
+            )
+            if not success:
+                shutil.rmtree(output_path, ignore_errors=True)
+                return False, f"Failed to populate linked working tree: {error}"
+            log_info(f"[INFO] Linked {linked} file(s), checked out {len(missing)} missing file(s)")
+        
         log_info(f"[DONE] Successfully cloned to '{output_path}'")
         return True, f"Successfully cloned to '{output_path}'"
     except subprocess.CalledProcessError as e:
-        error_msg = e.stderr if e.stderr else str(e)
-        return False, f"Failed to clone: {error_msg}"
\ No newline at end of file
+        # 반쯤 만들어진 출력 폴더가 남으면 다음 배치에서 "이미 존재"로 건너뛰므로 정리
+        shutil.rmtree(output_path, ignore_errors=True)
+        return False, f"Failed to clone: {_error_message(e)}"
+    except OSError as e:
+        shutil.rmtree(output_path, ignore_errors=True)
+        return False, f"Failed to clone: {e}"
\ No newline at end of file